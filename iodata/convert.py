@@ -140,18 +140,28 @@ def convert_conventions(
         Sign changes when going from 1 to 2, must be applied after permutation
 
     """
-    permutation = []
-    signs = []
-    for shell in molbasis.shells:
-        for angmom, kind in zip(shell.angmoms, shell.kinds):
-            key = (angmom, kind)
-            conv1 = molbasis.conventions[key]
-            conv2 = new_conventions[key]
-            shell_permutation, shell_signs = _convert_convention_shell(conv1, conv2, reverse)
-            offset = len(permutation)
-            permutation.extend(i + offset for i in shell_permutation)
-            signs.extend(shell_signs)
-    return np.array(permutation), np.array(signs)
+    # Each contraction contributes one (angmom, kind) block of basis functions.
+    keys = [
+        (angmom, kind)
+        for shell in molbasis.shells
+        for angmom, kind in zip(shell.angmoms, shell.kinds)
+    ]
+    # The conversion of a block is the same wherever its key appears,
+    # so derive it only once per unique key.
+    conversions = {
+        key: _convert_convention_shell(molbasis.conventions[key], new_conventions[key], reverse)
+        for key in set(keys)
+    }
+    sizes = np.array([len(conversions[key][0]) for key in keys], dtype=int)
+    offsets = np.cumsum(sizes) - sizes
+    permutation = np.empty(sizes.sum(), dtype=int)
+    signs = np.empty(sizes.sum(), dtype=int)
+    for key, (shell_permutation, shell_signs) in conversions.items():
+        key_offsets = offsets[[other == key for other in keys]]
+        indices = (key_offsets[:, None] + np.arange(len(shell_permutation))).ravel()
+        permutation[indices] = (key_offsets[:, None] + np.array(shell_permutation)).ravel()
+        signs[indices] = np.tile(shell_signs, len(key_offsets))
+    return permutation, signs
 
 
 def iter_cart_alphabet(n: int) -> NDArray[int]:
@@ -18,8 +18,14 @@
 # --
 """Gaussian FCHK file format."""
 
+import hashlib
+import os
+import re
+import zipfile
 from collections.abc import Iterator
-from fnmatch import fnmatch
+from contextlib import suppress
+from fnmatch import translate
+from functools import lru_cache
 from typing import Optional, TextIO
 from warnings import warn
 
@@ -62,6 +68,59 @@ CONVENTIONS = {
 }
 
 
+# Translation of FCHK run types to IOData run types.
+RUN_TYPES = {"SP": "energy", "FOpt": "opt", "Scan": "scan", "Freq": "freq"}
+
+
+# All field labels needed by load_one. Kept at module scope so the set is
+# built only once, which also weeds out duplicate entries.
+LOAD_ONE_LABELS = frozenset(
+    {
+        "Number of electrons",
+        "Number of basis functions",
+        "Number of alpha electrons",
+        "Number of beta electrons",
+        "Atomic numbers",
+        "Current cartesian coordinates",
+        "Real atomic weights",
+        "Shell types",
+        "Shell to atom map",
+        "Number of primitives per shell",
+        "Primitive exponents",
+        "Contraction coefficients",
+        "P(S=P) Contraction coefficients",
+        "Alpha Orbital Energies",
+        "Alpha MO coefficients",
+        "Beta Orbital Energies",
+        "Beta MO coefficients",
+        "Total Energy",
+        "Nuclear charges",
+        "Total SCF Density",
+        "Spin SCF Density",
+        "Total MP2 Density",
+        "Spin MP2 Density",
+        "Total MP3 Density",
+        "Spin MP3 Density",
+        "Total CC Density",
+        "Spin CC Density",
+        "Total CI Density",
+        "Spin CI Density",
+        "Mulliken Charges",
+        "ESP Charges",
+        "NPA Charges",
+        "MBS Charges",
+        "Type 6 Charges",
+        "Type 7 Charges",
+        "Polarizability",
+        "Dipole Moment",
+        "Quadrupole Moment",
+        "Cartesian Gradient",
+        "Cartesian Force Constants",
+        "MicOpt",
+    }
+)
+
+
 @document_load_one(
     "Gaussian Formatted Checkpoint",
     [
@@ -77,56 +136,15 @@ CONVENTIONS = {
         "title",
     ],
     ["energy", "atfrozen", "atgradient", "athessian", "atmasses", "one_rdms", "extra", "moments"],
+    {
+        "cache": "When True, the parsed fields are cached in an ``.npz`` file next to "
+        "the FCHK file, and subsequent loads of the same unmodified file "
+        "reuse the cache instead of parsing the text again."
+    },
 )
-def load_one(lit: LineIterator) -> dict:
+def load_one(lit: LineIterator, cache: bool = False) -> dict:
     """Do not edit this docstring. It will be overwritten."""
-    fchk = _load_fchk_low(
-        lit,
-        [
-            "Number of electrons",
-            "Number of basis functions",
-            "Number of alpha electrons",
-            "Number of beta electrons",
-            "Atomic numbers",
-            "Current cartesian coordinates",
-            "Real atomic weights",
-            "Shell types",
-            "Shell to atom map",
-            "Shell to atom map",
-            "Number of primitives per shell",
-            "Primitive exponents",
-            "Contraction coefficients",
-            "P(S=P) Contraction coefficients",
-            "Alpha Orbital Energies",
-            "Alpha MO coefficients",
-            "Beta Orbital Energies",
-            "Beta MO coefficients",
-            "Total Energy",
-            "Nuclear charges",
-            "Total SCF Density",
-            "Spin SCF Density",
-            "Total MP2 Density",
-            "Spin MP2 Density",
-            "Total MP3 Density",
-            "Spin MP3 Density",
-            "Total CC Density",
-            "Spin CC Density",
-            "Total CI Density",
-            "Spin CI Density",
-            "Mulliken Charges",
-            "ESP Charges",
-            "NPA Charges",
-            "MBS Charges",
-            "Type 6 Charges",
-            "Type 7 Charges",
-            "Polarizability",
-            "Dipole Moment",
-            "Quadrupole Moment",
-            "Cartesian Gradient",
-            "Cartesian Force Constants",
-            "MicOpt",
-        ],
-    )
+    fchk = _load_fchk_low(lit, LOAD_ONE_LABELS, cache=cache)
 
     # A) Load a bunch of simple things
     result = {
@@ -152,8 +170,7 @@ def load_one(lit: LineIterator) -> dict:
     atfrozen = fchk.get("MicOpt")
     if atfrozen is not None:
         result["atfrozen"] = atfrozen == -2
-    run_types = {"SP": "energy", "FOpt": "opt", "Scan": "scan", "Freq": "freq"}
-    run_type = run_types.get(fchk["command"])
+    run_type = RUN_TYPES.get(fchk["command"])
     if run_type is not None:
         result["run_type"] = run_type
 
@@ -165,10 +182,16 @@ def load_one(lit: LineIterator) -> dict:
     ccoeffs_level1 = fchk["Contraction coefficients"]
     ccoeffs_level2 = fchk.get("P(S=P) Contraction coefficients")
 
+    # The exponents and coefficients of all shells are stored contiguously,
+    # so the slice boundaries follow from a cumulative sum.
+    offsets = np.cumsum(nexps) - nexps
+    # Expand the coefficient columns once, instead of once per shell.
+    ccoeffs = ccoeffs_level1[:, np.newaxis]
+    if ccoeffs_level2 is not None:
+        sp_ccoeffs = np.stack([ccoeffs_level1, ccoeffs_level2], axis=1)
     shells = []
-    counter = 0
     # First loop over all shells
-    for i, n in enumerate(nexps):
+    for i, (begin, n) in enumerate(zip(offsets, nexps)):
         if shell_types[i] == -1:
             # Special treatment for SP shell type
             shells.append(
@@ -176,14 +199,8 @@ def load_one(lit: LineIterator) -> dict:
                     shell_map[i],
                     [0, 1],
                     ["c", "c"],
-                    exponents[counter : counter + n],
-                    np.stack(
-                        [
-                            ccoeffs_level1[counter : counter + n],
-                            ccoeffs_level2[counter : counter + n],
-                        ],
-                        axis=1,
-                    ),
+                    exponents[begin : begin + n],
+                    sp_ccoeffs[begin : begin + n],
                 )
             )
         else:
@@ -192,11 +209,10 @@ def load_one(lit: LineIterator) -> dict:
                     shell_map[i],
                     [abs(shell_types[i])],
                     ["p" if shell_types[i] < 0 else "c"],
-                    exponents[counter : counter + n],
-                    ccoeffs_level1[counter : counter + n][:, np.newaxis],
+                    exponents[begin : begin + n],
+                    ccoeffs[begin : begin + n],
                 )
             )
-        counter += n
     del shell_map
     del shell_types
     del nexps
@@ -227,15 +243,17 @@ def load_one(lit: LineIterator) -> dict:
         raise LoadError(f"n_alpha={nalpha} < n_beta={nbeta} is invalid.", lit)
 
     norba = fchk["Alpha Orbital Energies"].shape[0]
-    mo_coeffs = np.copy(fchk["Alpha MO coefficients"].reshape(norba, nbasis).T)
-    mo_energies = np.copy(fchk["Alpha Orbital Energies"])
+    # The FCHK file stores the coefficients orbital by orbital, so the
+    # transposed reshape is a free view on the loaded array and needs no copy.
+    mo_coeffs = fchk["Alpha MO coefficients"].reshape(norba, nbasis).T
+    mo_energies = fchk["Alpha Orbital Energies"]
 
     if "Beta Orbital Energies" in fchk:
         # unrestricted
         norbb = fchk["Beta Orbital Energies"].shape[0]
-        mo_coeffs_b = np.copy(fchk["Beta MO coefficients"].reshape(norbb, nbasis).T)
+        mo_coeffs_b = fchk["Beta MO coefficients"].reshape(norbb, nbasis).T
         mo_coeffs = np.concatenate((mo_coeffs, mo_coeffs_b), axis=1)
-        mo_energies = np.concatenate((mo_energies, np.copy(fchk["Beta Orbital Energies"])), axis=0)
+        mo_energies = np.concatenate((mo_energies, fchk["Beta Orbital Energies"]), axis=0)
         mo_occs = np.zeros(norba + norbb)
         mo_occs[:nalpha] = 1.0
         mo_occs[norba : norba + nbeta] = 1.0
@@ -368,7 +386,9 @@ def load_many(lit: LineIterator) -> Iterator[dict]:
             yield data
 
 
-def _load_fchk_low(lit: LineIterator, label_patterns: Optional[list[str]] = None) -> dict:
+def _load_fchk_low(
+    lit: LineIterator, label_patterns: Optional[list[str]] = None, cache: bool = False
+) -> dict:
     """Read selected fields from a formatted checkpoint file.
 
     Parameters
@@ -377,6 +397,10 @@ def _load_fchk_low(lit: LineIterator, label_patterns: Optional[list[str]] = None
         The line iterator to read the data from.
     label_patterns
         A list of Unix shell-style wildcard patterns of labels to read.
+    cache
+        When True, the parsed fields are stored in an ``.npz`` file next to the
+        FCHK file, keyed on its size, modification time and the label patterns,
+        and reused as long as the FCHK file is not modified.
 
     Returns
     -------
@@ -385,6 +409,17 @@ def _load_fchk_low(lit: LineIterator, label_patterns: Optional[list[str]] = None
     Arrays are always one-dimensional.
 
     """
+    cache_path = _get_fchk_cache_path(lit.filename, label_patterns) if cache else None
+    if cache_path is not None and os.path.isfile(cache_path):
+        try:
+            with np.load(cache_path) as npz:
+                return {
+                    label: value.item() if value.ndim == 0 else value
+                    for label, value in npz.items()
+                }
+        except (OSError, ValueError, zipfile.BadZipFile):
+            # A cache file that cannot be read is treated as a cache miss.
+            pass
     # Read the two-line header
     result = {"title": next(lit).strip()}
     words = next(lit).split()
@@ -395,29 +430,86 @@ def _load_fchk_low(lit: LineIterator, label_patterns: Optional[list[str]] = None
     else:
         raise LoadError("The second line of the FCHK file should contain two or three words.", lit)
 
-    while True:
-        try:
-            label, value = _load_fchk_field(lit, label_patterns)
-        except StopIteration:
-            # We always read until the end of the file.
-            break
+    if label_patterns is None:
+        exact_labels = None
+        wildcard_regex = None
+    else:
+        # Split the exact labels from the wildcard patterns: an exact label is
+        # matched with a single set lookup and is dropped once found, because
+        # each field appears at most once in an FCHK file.
+        exact_labels = {
+            pattern for pattern in label_patterns if not any(char in pattern for char in "*?[")
+        }
+        wildcard_patterns = [
+            pattern for pattern in label_patterns if any(char in pattern for char in "*?[")
+        ]
+        # Combine the wildcard patterns into one compiled regular expression,
+        # so every header line is matched with a single regex call.
+        wildcard_regex = (
+            re.compile("|".join(translate(pattern) for pattern in wildcard_patterns))
+            if wildcard_patterns
+            else None
+        )
+    for label, value in _iter_fchk_fields(lit, exact_labels, wildcard_regex):
         result[label] = value
+        if exact_labels is not None and not exact_labels and wildcard_regex is None:
+            # Every requested field has been found, so the remainder of the
+            # file does not have to be scanned.
+            break
+    if cache_path is not None:
+        # Write to a temporary file and rename it into place, so an
+        # interrupted write cannot leave a truncated cache behind. Caching is
+        # best-effort: when the directory is not writable, parse uncached.
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp.npz"
+        try:
+            np.savez(tmp_path, **result)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            with suppress(OSError):
+                os.remove(tmp_path)
     return result
 
 
-def _load_fchk_field(lit: LineIterator, label_patterns: list[str]) -> tuple[str, object]:
-    """Read a single field matching one of the given label_patterns.
+def _get_fchk_cache_path(filename: str, label_patterns: Optional[list[str]]) -> str:
+    """Return the path of the ``.npz`` cache file for an FCHK file.
 
     Parameters
     ----------
-    lit
-        The line iterator to read the data from.
+    filename
+        The path of the FCHK file.
     label_patterns
-        A list of Unix shell-style wildcard patterns. The next field matching
-        one of the patterns is returned
+        The label patterns requested from the file, or None to read all fields.
 
     Returns
     -------
+    The path of the cache file, a sibling of the FCHK file. The key in the
+    cache path changes when the FCHK file or the label patterns change, so a
+    stale cache is never reused.
+
+    """
+    st = os.stat(filename)
+    key = "\n".join([str(st.st_size), str(st.st_mtime_ns), *sorted(label_patterns or [])])
+    digest = hashlib.blake2b(key.encode(), digest_size=8).hexdigest()
+    return f"{filename}.{digest}.npz"
+
+
+def _iter_fchk_fields(
+    lit: LineIterator, exact_labels: Optional[set[str]], wildcard_regex: Optional[re.Pattern]
+) -> Iterator[tuple[str, object]]:
+    """Iterate over the fields matching one of the given labels or patterns.
+
+    Parameters
+    ----------
+    lit
+        The line iterator to read the data from.
+    exact_labels
+        A set of field labels without wildcards. A label is removed from the
+        set once its field has been read.
+    wildcard_regex
+        A compiled regular expression combining the wildcard patterns.
+
+    Yields
+    ------
     label
         The name of the field
     value
@@ -426,7 +518,11 @@ def _load_fchk_field(lit: LineIterator, label_patterns: list[str]) -> tuple[str,
     """
     while True:
         # find a sane header line
-        line = next(lit)
+        try:
+            line = next(lit)
+        except StopIteration:
+            # We always read until the end of the file.
+            return
         label = line[:43].strip()
         words = line[43:].split()
         if not words:
@@ -437,33 +533,69 @@ def _load_fchk_field(lit: LineIterator, label_patterns: list[str]) -> tuple[str,
             datatype = float
         else:
             continue
-        if not (
-            label_patterns is None
-            or any(fnmatch(label, label_pattern) for label_pattern in label_patterns)
-        ):
-            continue
+        if exact_labels is None:
+            wanted = True
+        elif label in exact_labels:
+            exact_labels.discard(label)
+            wanted = True
+        else:
+            wanted = wildcard_regex is not None and wildcard_regex.match(label) is not None
         if len(words) == 2:
+            if not wanted:
+                continue
             try:
-                return label, datatype(words[1])
+                value = datatype(words[1])
             except ValueError as exc:
                 raise LoadError(f"Could not interpret as {datatype}: {words[1]}", lit) from exc
+            yield label, value
         elif len(words) == 3:
             if words[1] != "N=":
+                if not wanted:
+                    continue
                 raise LoadError("Expected N= not found.", lit)
             length = int(words[2])
-            value = np.zeros(length, datatype)
-            counter = 0
-            words = []
-            while counter < length:
-                if not words:
-                    words = next(lit).split()
-                word = words.pop(0)
-                try:
-                    value[counter] = datatype(word)
-                except (ValueError, OverflowError) as exc:
-                    raise LoadError(f"Could not interpret as {datatype}: {word}", lit) from exc
-                counter += 1
-            return label, value
+            # The payload has a fixed layout: five reals or six integers per line.
+            per_line = 6 if datatype is int else 5
+            nlines = (length + per_line - 1) // per_line
+            try:
+                if not wanted:
+                    # Skip the payload of an unwanted field without tokenizing it.
+                    for _ in range(nlines):
+                        next(lit)
+                    continue
+                # Read all lines of the field at once and let NumPy convert the tokens,
+                # which is much faster than calling int or float on each token.
+                lines = [next(lit) for _ in range(nlines)]
+            except StopIteration:
+                # The file ends in the middle of a field, which is silently
+                # ignored, consistent with reading until the end of the file.
+                return
+            # Do not pass count to np.fromstring: with count, a payload holding
+            # fewer tokens than expected would be padded with uninitialized
+            # memory instead of triggering the fallback below.
+            try:
+                value = np.fromstring(" ".join(lines), dtype=datatype, sep=" ")
+            except ValueError:
+                value = None
+            if value is None or value.size != length:
+                # Fall back to parsing token by token, for files deviating from
+                # the fixed layout.
+                value = np.zeros(length, datatype)
+                counter = 0
+                words = [word for line in lines for word in line.split()]
+                while counter < length:
+                    if not words:
+                        try:
+                            words = next(lit).split()
+                        except StopIteration:
+                            return
+                    word = words.pop(0)
+                    try:
+                        value[counter] = datatype(word)
+                    except (ValueError, OverflowError) as exc:
+                        raise LoadError(f"Could not interpret as {datatype}: {word}", lit) from exc
+                    counter += 1
+            yield label, value
 
 
 def _load_dm(label: str, fchk: dict, result: dict, key: str):
@@ -485,6 +617,15 @@ def _load_dm(label: str, fchk: dict, result: dict, key: str):
         result[key] = _triangle_to_dense(fchk[label])
 
 
+@lru_cache(maxsize=8)
+def _tril_indices(nrow: int) -> tuple[NDArray[int], NDArray[int]]:
+    """Return the cached lower-triangle indices of a square matrix.
+
+    The returned arrays are shared between calls and must not be modified.
+    """
+    return np.tril_indices(nrow)
+
+
 def _triangle_to_dense(triangle: NDArray[float]) -> NDArray[float]:
     """Convert a symmetric matrix in triangular storage to a dense square matrix.
 
@@ -502,12 +643,9 @@ def _triangle_to_dense(triangle: NDArray[float]) -> NDArray[float]:
     """
     nrow = int(np.round((np.sqrt(1 + 8 * len(triangle)) - 1) / 2))
     result = np.zeros((nrow, nrow))
-    begin = 0
-    for irow in range(nrow):
-        end = begin + irow + 1
-        result[irow, : irow + 1] = triangle[begin:end]
-        result[: irow + 1, irow] = triangle[begin:end]
-        begin = end
+    irows, icols = _tril_indices(nrow)
+    result[irows, icols] = triangle
+    result[icols, irows] = triangle
     return result
 
 
@@ -657,8 +795,10 @@ def dump_one(f: TextIO, data: IOData):
     if data.obasis is not None:
         # number of primitives per shell
         nexps = np.array([shell.nexp for shell in data.obasis.shells])
-        exponents = np.array([item for shell in data.obasis.shells for item in shell.exponents])
-        coeffs = np.array([s.coeffs[i][0] for s in data.obasis.shells for i in range(s.nexp)])
+        # Concatenate whole per-shell arrays instead of collecting the
+        # elements one by one in Python lists.
+        exponents = np.concatenate([shell.exponents for shell in data.obasis.shells])
+        coeffs = np.concatenate([shell.coeffs[:, 0] for shell in data.obasis.shells])
         coordinates = np.array([data.atcoords[shell.icenter] for shell in data.obasis.shells])
         shell_to_atom = np.array([shell.icenter + 1 for shell in data.obasis.shells])
 
@@ -697,13 +837,13 @@ def dump_one(f: TextIO, data: IOData):
         _dump_real_arrays("Contraction coefficients", coeffs, f)
 
         if -1 in shell_types:
-            sp_coeffs = []
-            for shell, shell_type in zip(data.obasis.shells, shell_types):
-                if shell_type == -1:
-                    sp_coeffs.extend([shell.coeffs[i][1] for i in range(shell.nexp)])
-                else:
-                    sp_coeffs.extend([0.0] * shell.nexp)
-            _dump_real_arrays("P(S=P) Contraction coefficients", np.array(sp_coeffs), f)
+            sp_coeffs = np.concatenate(
+                [
+                    shell.coeffs[:, 1] if shell_type == -1 else np.zeros(shell.nexp)
+                    for shell, shell_type in zip(data.obasis.shells, shell_types)
+                ]
+            )
+            _dump_real_arrays("P(S=P) Contraction coefficients", sp_coeffs, f)
         _dump_real_arrays("Coordinates of each shell", coordinates.flatten(), f)
 
     # write energy
@@ -19,6 +19,7 @@
 """Test iodata.formats.fchk module."""
 
 import os
+import shutil
 from importlib.resources import as_file, files
 from typing import Optional
 
@@ -549,6 +550,61 @@ def test_load_nbasis_indep(tmpdir):
     assert mol2.mo.coeffs.shape == (38, 37)
 
 
+def test_load_fchk_wrapped_lines(tmpdir):
+    # Arrays written with fewer values per line than the standard five must
+    # still be parsed correctly, through the token-by-token fallback.
+    mol1 = load_fchk_helper("hf_sto3g.fchk")
+    with as_file(files("iodata.test.data").joinpath("hf_sto3g.fchk")) as fnin, open(fnin) as fh:
+        lines = fh.readlines()
+    label = "Current cartesian coordinates"
+    iheader = next(iline for iline, line in enumerate(lines) if line.startswith(label))
+    values = [float(word) for word in lines[iheader + 1].split() + lines[iheader + 2].split()]
+    payload = [
+        "".join(f"{value: 16.8E}" for value in values[ifirst : ifirst + 2]) + "\n"
+        for ifirst in range(0, len(values), 2)
+    ]
+    fn = os.path.join(tmpdir, "wrapped.fchk")
+    with open(fn, "w") as fh:
+        fh.writelines(lines[: iheader + 1] + payload + lines[iheader + 3 :])
+    mol2 = load_one(fn)
+    compare_mols(mol1, mol2)
+
+
+def test_load_fchk_cache(tmpdir):
+    with as_file(files("iodata.test.data").joinpath("hf_sto3g.fchk")) as fnin:
+        fn = os.path.join(tmpdir, "hf_sto3g.fchk")
+        shutil.copy(fnin, fn)
+    mol1 = load_one(fn, cache=True)
+    # The first load must have written a cache file next to the FCHK file.
+    assert len([name for name in os.listdir(tmpdir) if name.endswith(".npz")]) == 1
+    # The second load reads from the cache and must give the same molecule.
+    mol2 = load_one(fn, cache=True)
+    compare_mols(mol1, mol2)
+    # A corrupted cache file is treated as a cache miss, not an error.
+    cache_name = next(name for name in os.listdir(tmpdir) if name.endswith(".npz"))
+    with open(os.path.join(tmpdir, cache_name), "wb") as fh:
+        fh.write(b"not an npz file")
+    mol3 = load_one(fn, cache=True)
+    compare_mols(mol1, mol3)
+
+
+def test_load_fchk_cache_readonly(tmpdir, monkeypatch):
+    # When the cache cannot be written, e.g. in a read-only directory,
+    # caching degrades to a normal parse instead of failing.
+    with as_file(files("iodata.test.data").joinpath("hf_sto3g.fchk")) as fnin:
+        fn = os.path.join(tmpdir, "hf_sto3g.fchk")
+        shutil.copy(fnin, fn)
+
+    def raise_permission_error(*args, **kwargs):
+        raise PermissionError("Read-only directory.")
+
+    monkeypatch.setattr(np, "savez", raise_permission_error)
+    mol = load_one(fn, cache=True)
+    assert not any(name.endswith(".npz") for name in os.listdir(tmpdir))
+    monkeypatch.undo()
+    compare_mols(mol, load_one(fn))
+
+
 def check_load_dump_consistency(tmpdir: str, fn: str, match: Optional[str] = None):
     """Check if dumping and loading an FCHK file results in the same data.
 
@@ -94,7 +94,9 @@ class LineIterator:
         self.stack = []
 
     def __enter__(self):
-        self.fh = open(self.filename)
+        # Use a large buffer to reduce the number of read syscalls when
+        # loading files with megabytes of numerical data.
+        self.fh = open(self.filename, buffering=1 << 20)
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):